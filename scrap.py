@@ -1,28 +1,55 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+import orjson
+try:
+    import requests_cache  # opcional: solo necesario con --cache
+except ImportError:
+    requests_cache = None
 from datetime import datetime, timedelta
 import time
+import io
 import csv
 import re
 import os
-import hashlib
-import glob
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from calendar import monthrange
+from collections import namedtuple
+from contextlib import nullcontext
+
+FIELDNAMES = ['id', 'title', 'journal', 'date', 'abstract', 'scraped_date', "link","authors", "doi"]
+# Una fila del CSV: tupla en el orden de FIELDNAMES, lista para csv.writer
+Article = namedtuple('Article', FIELDNAMES)
+
+PUBMED_URL = "https://pubmed.ncbi.nlm.nih.gov"
+ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+EUTILS_TOOL = "artpubendo"  # identifica al scraper ante NCBI (parámetro `tool`)
+ESEARCH_PAGE_SIZE = 10000  # máximo de ESearch: una quincena cabe en una sola página
+EFETCH_BATCH_SIZE = 200  # NCBI recomienda hasta 200 IDs por llamada a EFetch
+EFETCH_WORKERS = 3  # lotes de EFetch en vuelo a la vez; el RateLimiter sigue marcando el ritmo
+
+# Rutas dentro de cada <PubmedArticle> del XML de EFetch (lxml las compila y cachea)
+PATH_PMID = "MedlineCitation/PMID"
+PATH_TITLE = "MedlineCitation/Article/ArticleTitle"
+PATH_JOURNAL = "MedlineCitation/Article/Journal/Title"
+PATH_YEAR = "MedlineCitation/Article/Journal/JournalIssue/PubDate/Year"
+PATH_ABSTRACT_TEXT = "MedlineCitation/Article/Abstract/AbstractText"
+PATH_DOI = "PubmedData/ArticleIdList/ArticleId[@IdType='doi']"
+PATH_AUTHORS = "MedlineCitation/Article/AuthorList/Author"
+
+# Cualquier secuencia de espacios en blanco (incluye \n y \r, problemáticos para CSV)
+_WS_RE = re.compile(r'\s+')
+
+# Nombre de los archivos numerados del período (data/articulos_X.csv)
+_CSV_NUMBER_RE = re.compile(r'articulos_(\d+)\.csv')
 
 def clean_text(text):
     """Limpia el texto de caracteres problemáticos"""
-    if text:
-        # Remover múltiples espacios y saltos de línea
-        text = re.sub(r'\s+', ' ', text)
-        # Remover caracteres problemáticos para CSV
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        return text.strip()
-    return ""
-
-def generate_article_id(title, journal, date):
-    """Genera un ID único para el artículo basado en título, revista y fecha"""
-    content = f"{title}_{journal}_{date}"
-    return hashlib.md5(content.encode()).hexdigest()
+    return _WS_RE.sub(' ', text).strip() if text else ""
 
 def get_date_range():
     """Calcula el rango de fechas para quincenas completas del MES ACTUAL"""
@@ -49,139 +76,323 @@ def get_date_range():
 
 def get_next_csv_number(csv_dir='data'):
     """Encuentra el siguiente número para articulos_X.csv"""
-    if not os.path.exists(csv_dir):
+    try:
+        entries = os.scandir(csv_dir)
+    except FileNotFoundError:
         return 1
     
-    pattern = os.path.join(csv_dir, 'articulos_*.csv')
-    csv_files = glob.glob(pattern)
-    
+    # Un solo recorrido del directorio, usando el nombre que ya trae cada entrada
     numbers = []
-    for file in csv_files:
-        filename = os.path.basename(file)
-        match = re.match(r'articulos_(\d+)\.csv', filename)
-        if match:
-            numbers.append(int(match.group(1)))
+    with entries:
+        for entry in entries:
+            match = _CSV_NUMBER_RE.fullmatch(entry.name)
+            if match:
+                numbers.append(int(match.group(1)))
     
     return max(numbers) + 1 if numbers else 1
 
-def get_articles(start_date, end_date):
-    """Obtiene artículos de PubMed usando la API E-Utilities (JSON/XML)"""
-    base_search = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-    base_fetch = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+class RateLimiter:
+    """Token bucket: permite como máximo `rate` peticiones por segundo"""
     
-    # Construir query (igual que antes)
-    query = f'("International endodontic journal"[Journal] OR "Journal of endodontics"[Journal]) AND ("{start_date}"[Date - Entry] : "{end_date}"[Date - Entry])'
-    print(f"🔍 Búsqueda API: {query}")
+    def __init__(self, rate, burst=1):
+        # Con burst=1 ninguna ventana de 1 s supera `rate` peticiones, como exige NCBI
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Consume un token, esperando solo lo necesario si el cubo está vacío"""
+        # El lock se mantiene durante la espera: los hilos salen de uno en uno y a ritmo
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0
+                self.updated = time.monotonic()
+            else:
+                self.tokens -= 1
+
+def create_session(cache_file=None):
+    """Crea la sesión HTTP con reintentos y backoff; con cache_file guarda las respuestas en SQLite"""
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,  # 0.5, 1, 2, 4... s entre reintentos (respeta Retry-After en 429/503)
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods={"GET", "POST"},  # EFetch por POST es de solo lectura
+    )
+    if cache_file:
+        if requests_cache is None:
+            raise RuntimeError("La caché requiere el paquete requests-cache (pip install requests-cache)")
+        session = requests_cache.CachedSession(
+            cache_file,
+            backend="sqlite",
+            allowable_methods=("GET", "POST"),
+            cache_control=True,
+            urls_expire_after={
+                # La búsqueda cambia a lo largo de la quincena: se revalida siempre con
+                # If-None-Match/If-Modified-Since (304 sin cuerpo si no cambió).
+                # Los registros por PMID apenas cambian y se reutilizan sin preguntar.
+                "*/esearch.fcgi": requests_cache.EXPIRE_IMMEDIATELY,
+                "*/efetch.fcgi": timedelta(days=14),
+            },
+        )
+    else:
+        session = requests.Session()
+    # Todas las peticiones van al mismo host; requests ya pide gzip/deflate por defecto.
+    # Una conexión persistente por hilo de EFetch: ninguna se descarta y re-negocia TLS
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=EFETCH_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+def element_text(element):
+    """Texto completo de un elemento XML, incluido el de etiquetas internas como <i> o <sup>"""
+    return "".join(element.itertext())
+
+def parse_article(article, scraped_date):
+    """Convierte un <PubmedArticle> en una fila (Article) del CSV"""
+    # ID único: el PMID, estable y ya conocido desde ESearch
+    pmid = article.findtext(PATH_PMID).strip()
     
-    # Paso 1: obtener IDs de artículos
-    params_search = {
-        "db": "pubmed",
-        "term": query,
-        "retmax": 200,  # hasta 200 artículos por llamada
-        "retmode": "json"
-    }
-    r = requests.get(base_search, params=params_search)
-    data = r.json()
-    
-    ids = data.get("esearchresult", {}).get("idlist", [])
-    print(f"📄 {len(ids)} artículos encontrados")
-    if not ids:
-        return []
-    
-    # Paso 2: obtener detalles de los artículos
-    params_fetch = {
-        "db": "pubmed",
-        "id": ",".join(ids),
-        "retmode": "xml"
-    }
-    r = requests.get(base_fetch, params=params_fetch)
-    soup = BeautifulSoup(r.text, "xml")
+    title = clean_text(element_text(article.find(PATH_TITLE)))
     
+    # Journal
+    journal = clean_text(article.findtext(PATH_JOURNAL))
+    
+    # Fecha
+    year = article.findtext(PATH_YEAR) or "n.d."
+    
+    # Abstract
+    abstract_parts = [element_text(p) for p in article.iterfind(PATH_ABSTRACT_TEXT)]
+    abstract = clean_text(" ".join(abstract_parts)) if abstract_parts else "No abstract available"
+    
+    # DOI
+    doi = article.findtext(PATH_DOI) or "No DOI"
+    
+    # Autores
+    authors = []
+    for author in article.iterfind(PATH_AUTHORS):
+        lastname = author.findtext("LastName")
+        firstname = author.findtext("ForeName")
+        if lastname and firstname:
+            authors.append(f"{firstname} {lastname}")
+        elif lastname:
+            authors.append(lastname)
+    authors_str = "; ".join(authors) if authors else "No authors listed"
+    
+    return Article(
+        id=pmid,
+        title=title,
+        journal=journal,
+        date=year,
+        abstract=abstract,
+        scraped_date=scraped_date,
+        link=f"{PUBMED_URL}/{pmid}/",
+        authors=authors_str,
+        doi=doi
+    )
+
+def parse_articles(xml_bytes):
+    """Extrae los artículos de un documento XML de EFetch procesándolo en streaming"""
+    scraped_date = datetime.now().strftime("%Y-%m-%d")
     articulos = []
-    for article in soup.find_all("PubmedArticle"):
+    # iterparse entrega cada <PubmedArticle> completo; se libera tras procesarlo
+    for _, article in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag="PubmedArticle"):
         try:
-            title = clean_text(article.find("ArticleTitle").text)
-            
-            # Abstract
-            abstract_tag = article.find("Abstract")
-            abstract = clean_text(" ".join(p.text for p in abstract_tag.find_all("AbstractText"))) if abstract_tag else "No abstract available"
-            
-            # Journal
-            journal = clean_text(article.find("Title").text)
-            
-            # Fecha
-            date_tag = article.find("PubDate")
-            year = date_tag.find("Year").text if date_tag and date_tag.find("Year") else "n.d."
-            
-            # DOI
-            doi_tag = article.find("ArticleId", IdType="doi")
-            doi = doi_tag.text if doi_tag else "No DOI"
-            
-            # Autores
-            authors = []
-            for author in article.find_all("Author"):
-                lastname = author.find("LastName")
-                firstname = author.find("ForeName")
-                if lastname and firstname:
-                    authors.append(f"{firstname.text} {lastname.text}")
-                elif lastname:
-                    authors.append(lastname.text)
-            authors_str = "; ".join(authors) if authors else "No authors listed"
-            
-            # ID único
-            article_id = generate_article_id(title, journal, year)
-            
-            articulos.append({
-                "id": article_id,
-                "title": title,
-                "journal": journal,
-                "date": year,
-                "authors": authors_str,
-                "doi": doi,
-                "abstract": abstract,
-                "scraped_date": datetime.now().strftime("%Y-%m-%d")
-            })
+            articulos.append(parse_article(article, scraped_date))
         except Exception as e:
             print(f"⚠️ Error procesando artículo: {e}")
-            continue
+        finally:
+            # clear() vacía el elemento, pero el nodo sigue colgando de <PubmedArticleSet>:
+            # se eliminan también los hermanos ya procesados para que la memoria no crezca
+            article.clear(keep_tail=True)
+            while article.getprevious() is not None:
+                del article.getparent()[0]
     
     return articulos
 
-def load_existing_articles(master_file='articulos_maestro/articulos.csv'):
-    """Carga los artículos existentes del archivo maestro"""
-    existing_articles = {}
-    if os.path.exists(master_file):
-        with open(master_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                existing_articles[row['id']] = row
-    return existing_articles
-
-def save_to_master(articles, master_file='articulos_maestro/articulos.csv'):
-    """Guarda artículos en el archivo maestro, evitando duplicados"""
-    existing_articles = load_existing_articles(master_file)
-    
-    # Filtrar artículos nuevos
-    new_articles = [article for article in articles if article['id'] not in existing_articles]
+def iter_articles(start_date, end_date, *, session=None, api_key=None, email=None, existing_ids=frozenset(), cache_file=None):
+    """Genera los artículos de PubMed (API E-Utilities) a medida que llega cada lote; acepta una sesión HTTP ya creada"""
+    api_key = api_key or os.environ.get("NCBI_API_KEY")
+    # NCBI permite 3 peticiones/s sin API key y 10 peticiones/s con ella
+    limiter = RateLimiter(10 if api_key else 3)
+    email = email or os.environ.get("NCBI_EMAIL")
+    # NCBI pide `tool` y `email` para poder contactar antes de bloquear un cliente
+    base_params = {"db": "pubmed", "tool": EUTILS_TOOL}
+    if email:
+        base_params["email"] = email
+    if api_key:
+        base_params["api_key"] = api_key
     
-    if not new_articles:
-        print("No hay artículos nuevos para agregar al archivo maestro")
-        return 0
+    # Construir query (igual que antes)
+    query = f'("International endodontic journal"[Journal] OR "Journal of endodontics"[Journal]) AND ("{start_date}"[Date - Entry] : "{end_date}"[Date - Entry])'
+    print(f"🔍 Búsqueda API: {query}")
     
-    # Combinar existentes con nuevos
-    all_articles = list(existing_articles.values()) + new_articles
+    # Una sola sesión para ESearch + EFetch: reutiliza la conexión TCP/TLS.
+    # Una sesión recibida del llamador no se cierra aquí.
+    with create_session(cache_file) if session is None else nullcontext(session) as session:
+        # Paso 1: obtener IDs de artículos, paginando ESearch
+        ids = []
+        while True:
+            params_search = {
+                **base_params,
+                "term": query,
+                "retstart": len(ids),
+                "retmax": ESEARCH_PAGE_SIZE,
+                "retmode": "json"
+            }
+            limiter.wait()
+            r = session.get(ESEARCH_URL, params=params_search, timeout=30)
+            r.raise_for_status()
+            # orjson parsea los bytes directamente, sin decodificar antes a str
+            result = orjson.loads(r.content).get("esearchresult", {})
+            page = result.get("idlist", [])
+            ids.extend(page)
+            if not page or len(ids) >= int(result.get("count", 0)):
+                break
+        
+        print(f"📄 {len(ids)} artículos encontrados")
+        # Los PMID ya guardados se descartan antes de pedirlos a EFetch
+        ids = [pmid for pmid in ids if pmid not in existing_ids]
+        print(f"🆕 {len(ids)} artículos por descargar")
+        if not ids:
+            return
+        
+        # Paso 2: obtener detalles en lotes; POST evita URLs demasiado largas
+        def fetch_batch(batch):
+            params_fetch = {
+                **base_params,
+                "id": ",".join(batch),
+                "retmode": "xml"
+            }
+            limiter.wait()
+            r = session.post(EFETCH_URL, data=params_fetch, timeout=60)
+            r.raise_for_status()
+            # Se parsea en el mismo hilo, directamente desde los bytes: libxml2 decodifica
+            # según la declaración XML y la respuesta se libera en cuanto termina el lote
+            return parse_articles(r.content)
+        
+        # Los lotes se descargan y parsean en paralelo (misma sesión y pool de conexiones)
+        # y se recogen en orden
+        batches = [ids[i:i + EFETCH_BATCH_SIZE] for i in range(0, len(ids), EFETCH_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=EFETCH_WORKERS) as executor:
+            for batch_articles in executor.map(fetch_batch, batches):
+                yield from batch_articles
+
+def get_articles(start_date, end_date, **kwargs):
+    """Obtiene todos los artículos de iter_articles en una lista"""
+    return list(iter_articles(start_date, end_date, **kwargs))
+
+def migrate_old_format(master_file='articulos_maestro/articulos.csv'):
+    """Reescribe una única vez un archivo maestro antiguo con las columnas actuales (los IDs se conservan)"""
+    if not os.path.exists(master_file):
+        return
+    with open(master_file, 'r', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        # Vacío (sin cabecera) o ya en el formato actual: nada que migrar
+        if reader.fieldnames is None or reader.fieldnames == FIELDNAMES:
+            return
+        rows = list(reader)
     
-    # Guardar todo
     with open(master_file, 'w', newline='', encoding='utf-8-sig') as f:
-        fieldnames = ['id', 'title', 'journal', 'date', 'abstract', 'scraped_date', "link","authors", "doi"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
         writer.writeheader()
-        writer.writerows(all_articles)
+        writer.writerows(rows)
+    print(f"🔧 Archivo maestro migrado al formato actual ({len(rows)} artículos)")
+
+def get_index_file(master_file='articulos_maestro/articulos.csv'):
+    """Ruta del índice de IDs (uno por línea) que acompaña al archivo maestro"""
+    return os.path.splitext(master_file)[0] + '.ids'
+
+def master_has_articles(master_file='articulos_maestro/articulos.csv'):
+    """Indica si el archivo maestro existe y tiene al menos un artículo bajo la cabecera"""
+    if not os.path.exists(master_file) or os.path.getsize(master_file) == 0:
+        return False
+    with open(master_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        return any(row for row in reader)
+
+def load_existing_ids(master_file='articulos_maestro/articulos.csv', rebuild_index=False):
+    """Carga los IDs de los artículos existentes desde el índice, o del archivo maestro si hay que reconstruirlo"""
+    # Maestro ausente, vacío o solo con cabecera (p. ej. truncado por una ejecución fallida):
+    # no hay nada guardado y el índice, si existe, no es fiable
+    if not master_has_articles(master_file):
+        return set()
+    
+    index_file = get_index_file(master_file)
+    if not rebuild_index and os.path.exists(index_file):
+        with open(index_file, 'r', encoding='utf-8') as f:
+            return set(f.read().split())
+    
+    with open(master_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        id_idx = next(reader).index('id')
+        ids = {row[id_idx] for row in reader if row}
+    
+    with open(index_file, 'w', encoding='utf-8') as f:
+        f.writelines(f"{article_id}\n" for article_id in ids)
+    print(f"🔧 Índice de IDs reconstruido: {index_file}")
+    return ids
+
+class MasterWriter:
+    """Añade artículos de uno en uno al archivo maestro y a su índice de IDs, descartando duplicados"""
+    
+    def __init__(self, master_file, existing_ids):
+        # El llamador ya migró el maestro y cargó existing_ids; el set se actualiza con cada artículo nuevo
+        self.master_file = master_file
+        self.existing_ids = existing_ids
+        self.new_count = 0
+    
+    def __enter__(self):
+        self.file = open(self.master_file, 'a', newline='', encoding='utf-8-sig')
+        self.index_file = open(get_index_file(self.master_file), 'a', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        # Cabecera solo si el archivo está vacío
+        if self.file.tell() == 0:
+            self.writer.writerow(FIELDNAMES)
+        return self
+    
+    def __exit__(self, *exc):
+        self.index_file.close()
+        self.file.close()
     
-    return len(new_articles)
+    def add(self, article):
+        """Añade el artículo al final si no estaba ya; devuelve True si era nuevo"""
+        if article.id in self.existing_ids:
+            return False
+        self.writer.writerow(article)
+        self.index_file.write(f"{article.id}\n")
+        self.existing_ids.add(article.id)
+        self.new_count += 1
+        return True
+
+def save_to_master(articles, master_file='articulos_maestro/articulos.csv'):
+    """Guarda artículos en el archivo maestro a medida que llegan, evitando duplicados"""
+    migrate_old_format(master_file)
+    with MasterWriter(master_file, load_existing_ids(master_file)) as master:
+        for article in articles:
+            master.add(article)
+    
+    if not master.new_count:
+        print("No hay artículos nuevos para agregar al archivo maestro")
+    return master.new_count
 
 # Ejecutar y guardar resultados
-if __name__ == "__main__":
+def main(argv=None):
+    """Punto de entrada: busca los artículos de la quincena y actualiza los CSV"""
+    parser = argparse.ArgumentParser(description="Scraper de artículos de endodoncia en PubMed")
+    parser.add_argument("--rebuild-index", action="store_true",
+                        help="reconstruye el índice de IDs a partir del archivo maestro")
+    parser.add_argument("--backfill", action="store_true",
+                        help="descarga todos los artículos del período, incluidos los ya guardados")
+    parser.add_argument("--cache", nargs="?", const="pubmed_cache.sqlite", metavar="ARCHIVO",
+                        help="guarda las respuestas de NCBI en una caché SQLite local (requiere requests-cache)")
+    args = parser.parse_args(argv)
+    
     # Crear carpetas si no existen
     data_dir = 'data'
     maestro_dir = 'articulos_maestro'
@@ -193,27 +404,46 @@ if __name__ == "__main__":
     
     print(f"Buscando artículos desde {start_date} hasta {end_date}")
     
-    resultados = get_articles(start_date, end_date)
+    # IDs ya guardados: se cargan una vez y se descartan antes de llamar a EFetch
+    master_file = os.path.join(maestro_dir, 'articulos.csv')
+    migrate_old_format(master_file)
+    # Un índice sin artículos en el maestro es obsoleto: se descarta para no seguir añadiendo a él
+    index_file = get_index_file(master_file)
+    if os.path.exists(index_file) and not master_has_articles(master_file):
+        os.remove(index_file)
+        print(f"🔧 Índice de IDs obsoleto descartado: {index_file}")
+    existing_ids = load_existing_ids(master_file, args.rebuild_index)
+    
+    # En modo incremental (por defecto) solo se piden a EFetch los PMID que no están en el maestro
+    skip_ids = frozenset() if args.backfill else frozenset(existing_ids)
+    resultados = iter_articles(start_date, end_date, existing_ids=skip_ids, cache_file=args.cache)
     
     # 1. Crear archivo numerado articulos_X.csv en carpeta data/
     next_number = get_next_csv_number(data_dir)
     numbered_filename = os.path.join(data_dir, f"articulos_{next_number}.csv")
     
+    found = 0
+    
     # Guardar archivo del período - como el original pero con encoding mejorado
-    with open(numbered_filename, 'w', newline='', encoding='utf-8-sig') as f:
-        fieldnames = ['id', 'title', 'journal', 'date', 'abstract', 'scraped_date', "link","authors", "doi"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(resultados)
+    # 2. Agregar al archivo maestro en carpeta articulos_maestro/, en la misma pasada:
+    # cada artículo se escribe en ambos CSV en cuanto llega, sin lista intermedia
+    with open(numbered_filename, 'w', newline='', encoding='utf-8-sig') as f, \
+            MasterWriter(master_file, existing_ids) as master:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for article in resultados:
+            writer.writerow(article)
+            found += 1
+            master.add(article)
     
+    if not master.new_count:
+        print("No hay artículos nuevos para agregar al archivo maestro")
     print(f"✓ Archivo del período guardado: {numbered_filename}")
-    
-    # 2. Agregar al archivo maestro en carpeta articulos_maestro/
-    master_file = os.path.join(maestro_dir, 'articulos.csv')
-    new_count = save_to_master(resultados, master_file)
-    
-    print(f"✓ Se encontraron {len(resultados)} artículos en este período")
-    print(f"✓ Se agregaron {new_count} artículos nuevos al archivo maestro")
+    print(f"✓ Se descargaron {found} artículos de este período")
+    print(f"✓ Se agregaron {master.new_count} artículos nuevos al archivo maestro")
     print(f"✓ Archivos guardados:")
     print(f"   - {numbered_filename} (período actual)")
     print(f"   - {master_file} (maestro acumulativo)")
+
+if __name__ == "__main__":
+    main()